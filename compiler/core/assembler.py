@@ -2,13 +2,81 @@ from cpu_profile_base import ConfigCPUProfile
 from core.symbol_table import SymbolTable
 from core.diagnostics import Diagnostics
 from core.program import Program
-from core.expression_evaluator import evaluate_expression
+from core.expression_evaluator import evaluate_ast
 
 class Assembler:
     def __init__(self, cpu_profile: ConfigCPUProfile, symbol_table: 'SymbolTable', diagnostics: 'Diagnostics'):
         self.cpu_profile = cpu_profile
         self.symbol_table = symbol_table
         self.diagnostics = diagnostics
+        # First-pass directive handlers keyed by the profile's directive type.
+        # Each returns the new current address, or None on failure.
+        self._directive_handlers = {
+            "symbol_equate": self._handle_equate,      # e.g., EQU
+            "origin_set": self._handle_origin,         # e.g., .ORG
+            "data_define": self._handle_data,          # e.g., .BYTE, .WORD
+            "storage_define": self._handle_storage,    # e.g., .DS
+        }
+
+    def _handle_equate(self, instr, directive_info, current_address):
+        if not instr.label:
+            self.diagnostics.error(instr.line_num, f"Directive '{instr.directive}' requires a label.")
+            return None
+        equ_value = evaluate_ast(instr.operand_value, self.symbol_table, instr.line_num, current_address)
+        if equ_value is None:
+            return None
+        if not self.symbol_table.add(instr.label, equ_value, instr.line_num):
+            return None
+        instr.size = 0
+        # Don't add label to symbol table again (already handled by EQU)
+        return current_address
+
+    def _handle_origin(self, instr, directive_info, current_address):
+        org_address = evaluate_ast(instr.operand_value, self.symbol_table, instr.line_num, current_address)
+        if org_address is None:
+            return None
+        instr.address = org_address
+        instr.size = 0
+        # Add label if present (labels after .ORG point to new address)
+        if instr.label:
+            if not self.symbol_table.add(instr.label, org_address, instr.line_num):
+                return None
+        return org_address
+
+    def _handle_data(self, instr, directive_info, current_address):
+        instr.address = current_address
+        size_multiplier = directive_info.get("size_multiplier", 1)
+        # Size is calculated based on number of operands
+        instr.size = len(instr.operand_value) * size_multiplier
+        # Add label if present (labels before data directives point to data)
+        if instr.label:
+            if not self.symbol_table.add(instr.label, instr.address, instr.line_num):
+                return None
+        return current_address + instr.size
+
+    def _handle_storage(self, instr, directive_info, current_address):
+        instr.address = current_address
+        # Size is the value of the operand (number of bytes to reserve)
+        storage_size = evaluate_ast(instr.operand_value, self.symbol_table, instr.line_num, current_address)
+        if storage_size is None:
+            return None
+        instr.size = storage_size
+        # Add label if present (labels before storage directives point to storage)
+        if instr.label:
+            if not self.symbol_table.add(instr.label, instr.address, instr.line_num):
+                return None
+        return current_address + instr.size
+
+    def _handle_legacy_directive(self, instr, directive_info, current_address):
+        try:
+            current_address = self.cpu_profile.handle_directive_pass1(instr, self.symbol_table, current_address)
+        except ValueError as e:
+            self.diagnostics.error(instr.line_num, str(e))
+            return None
+        if instr.label:
+            if not self.symbol_table.add(instr.label, current_address, instr.line_num):
+                return None
+        return current_address
 
     def _first_pass(self, program: 'Program', start_address):
         current_address = start_address
@@ -20,67 +88,11 @@ class Assembler:
                     self.diagnostics.error(instr.line_num, f"Unknown directive '{instr.directive}'")
                     return False
 
-                directive_type = directive_info.get("type")
-
-                if directive_type == "symbol_equate":  # e.g., EQU
-                    if not instr.label:
-                        self.diagnostics.error(instr.line_num, f"Directive '{instr.directive}' requires a label.")
-                        return False
-                    equ_value = evaluate_expression(instr.operand_value, self.symbol_table, instr.line_num, current_address)
-                    if equ_value is None:
-                        return False
-                    if not self.symbol_table.add(instr.label, equ_value, instr.line_num):
-                        return False
-                    instr.size = 0
-                    # Don't add label to symbol table again (already handled by EQU)
-                    
-                elif directive_type == "origin_set":  # e.g., .ORG
-                    org_address = evaluate_expression(instr.operand_value, self.symbol_table, instr.line_num, current_address)
-                    if org_address is None:
-                        return False
-                    current_address = org_address
-                    instr.address = current_address
-                    instr.size = 0
-                    # Add label if present (labels after .ORG point to new address)
-                    if instr.label:
-                        if not self.symbol_table.add(instr.label, current_address, instr.line_num):
-                            return False
-                            
-                elif directive_type == "data_define":  # e.g., .BYTE, .WORD
-                    instr.address = current_address
-                    size_multiplier = directive_info.get("size_multiplier", 1)
-                    # Size is calculated based on number of operands
-                    instr.size = len(instr.operand_value) * size_multiplier
-                    current_address += instr.size
-                    # Add label if present (labels before data directives point to data)
-                    if instr.label:
-                        if not self.symbol_table.add(instr.label, instr.address, instr.line_num):
-                            return False
-                            
-                elif directive_type == "storage_define":  # e.g., .DS
-                    instr.address = current_address
-                    # Size is the value of the operand (number of bytes to reserve)
-                    storage_size = evaluate_expression(instr.operand_value, self.symbol_table, instr.line_num, current_address)
-                    if storage_size is None:
-                        return False
-                    instr.size = storage_size
-                    current_address += instr.size
-                    # Add label if present (labels before storage directives point to storage)
-                    if instr.label:
-                        if not self.symbol_table.add(instr.label, instr.address, instr.line_num):
-                            return False
-                            
-                else:
-                    # Unknown directive type - try legacy profile handling
-                    try:
-                        current_address = self.cpu_profile.handle_directive_pass1(instr, self.symbol_table, current_address)
-                        # For legacy compatibility, check if this is a symbol_equate type
-                        if directive_type != "symbol_equate" and instr.label:
-                            if not self.symbol_table.add(instr.label, current_address, instr.line_num):
-                                return False
-                    except ValueError as e:
-                        self.diagnostics.error(instr.line_num, str(e))
-                        return False
+                # Dispatch on directive type; unknown types fall back to legacy profile handling
+                handler = self._directive_handlers.get(directive_info.get("type"), self._handle_legacy_directive)
+                current_address = handler(instr, directive_info, current_address)
+                if current_address is None:
+                    return False
                 continue
 
             if instr.label:
@@ -108,17 +120,21 @@ class Assembler:
         return True
 
     def _second_pass(self, program: 'Program'):
+        # Bind the per-instruction calls once; this loop runs for every line
+        symbol_table = self.symbol_table
+        handle_directive = self.cpu_profile.handle_directive_pass2
+        encode_instruction = self.cpu_profile.encode_instruction
         for instr in program.instructions:
             if instr.directive:
                 # Let the profile handle its own directive logic
-                if not self.cpu_profile.handle_directive_pass2(instr, self.symbol_table):
+                if not handle_directive(instr, symbol_table):
                     return False
             elif instr.mnemonic:
                 try:
-                    if not self.cpu_profile.encode_instruction(instr, self.symbol_table):
+                    if not encode_instruction(instr, symbol_table):
                         return False
                 except ValueError as e:
-                    self.diagnostics.logger.debug(f"Exception during instruction encoding on line {instr.line_num}", exc_info=True)
+                    self.diagnostics.logger.debug("Exception during instruction encoding on line %d", instr.line_num, exc_info=True)
                     self.diagnostics.error(instr.line_num, f"Error encoding {instr.mnemonic}: {e}")
                     return False
         self.diagnostics.info("Pass 2 complete.")
@@ -3,6 +3,7 @@ A dedicated module for handling all diagnostic output, including errors,
 warnings, and informational messages.
 """
 import logging
+import sys
 
 class Diagnostics:
     """Manages and displays diagnostic messages for the assembler."""
@@ -11,25 +12,58 @@ class Diagnostics:
         self._warning_count = 0
         # Use provided logger or a null logger to avoid conditional checks
         self.logger = logger or logging.getLogger('null')
+        # Only forward messages to the logger when one was actually configured
+        self._logger_enabled = logger is not None
+        # Pending console lines while batching, or None when printing directly
+        self._batch = None
+        # Number of open begin_batch() calls; output is flushed when it returns to zero
+        self._batch_depth = 0
+
+    def _write(self, message):
+        """Writes a line to the console, or queues it while a batch is open."""
+        if self._batch is not None:
+            self._batch.append(message)
+        else:
+            print(message)
+
+    def begin_batch(self):
+        """Starts queueing console output until the matching end_batch() is called."""
+        if self._batch_depth == 0:
+            self._batch = []
+        self._batch_depth += 1
+
+    def end_batch(self):
+        """Closes a batch, writing all queued output in a single call once the outermost one ends."""
+        if self._batch_depth == 0:
+            return
+        self._batch_depth -= 1
+        if self._batch_depth:
+            return
+        lines, self._batch = self._batch, None
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
 
     def error(self, line_num, message):
         """Reports a compilation error to the console and the logger."""
         self._error_count += 1
         full_message = f"Error on line {line_num}: {message}" if line_num else f"Error: {message}"
-        print(full_message)
-        self.logger.error(full_message)
+        self._write(full_message)
+        if self._logger_enabled:
+            self.logger.error(full_message)
 
     def warning(self, line_num, message):
         """Reports a compilation warning to the console and the logger."""
         self._warning_count += 1
         full_message = f"Warning on line {line_num}: {message}" if line_num else f"Warning: {message}"
-        print(full_message)
-        self.logger.warning(full_message)
+        self._write(full_message)
+        if self._logger_enabled:
+            self.logger.warning(full_message)
 
     def info(self, message):
         """Prints a general informational message to the console and the logger."""
-        print(message)
-        self.logger.info(message)
+        self._write(message)
+        if self._logger_enabled:
+            self.logger.info(message)
 
     def has_errors(self):
         """Returns True if any errors have been reported."""
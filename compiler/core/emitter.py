@@ -1,6 +1,12 @@
 import os
 from core.diagnostics import Diagnostics
 
+# Flat images whose emitted bytes cover less than this fraction are reported as sparse
+SPARSE_IMAGE_RATIO = 0.2
+
+# Maximum data bytes per Intel HEX record
+HEX_RECORD_SIZE = 16
+
 class Emitter:
     """
     Handles the output of the assembly process, including printing listings
@@ -11,59 +17,153 @@ class Emitter:
 
     def print_pass_listing(self, title, program):
         """Prints a detailed listing of the program state after a pass."""
-        self.diagnostics.info(f"--- {title} ---")
-        header = f"{'Address':<8} {'Size':<5} {'Bytes':<20} {'Original Source'}"
-        self.diagnostics.info(header)
-        self.diagnostics.info("-" * (len(header) + 20))
+        self.diagnostics.begin_batch()
+        try:
+            self.diagnostics.info(f"--- {title} ---")
+            header = f"{'Address':<8} {'Size':<5} {'Bytes':<20} {'Original Source'}"
+            self.diagnostics.info(header)
+            self.diagnostics.info("-" * (len(header) + 20))
 
-        for instr in program.instructions:
-            addr_str = f"{instr.address:04X}" if instr.address is not None else "----"
-            size_str = str(instr.size)
-            bytes_str = " ".join(f"{b:02X}" for b in instr.machine_code) if instr.machine_code is not None else ""
+            # Bind the row formatter once for the whole listing
+            format_row = "{:<8} {:<5} {:<20} {}".format
+            for instr in program.instructions:
+                addr_str = f"{instr.address:04X}" if instr.address is not None else "----"
+                bytes_str = bytes(instr.machine_code).hex(' ').upper() if instr.machine_code is not None else ""
 
-            self.diagnostics.info(f"{addr_str:<8} {size_str:<5} {bytes_str:<20} {instr.original_text}")
-        self.diagnostics.info("") # Add a blank line for spacing
+                self.diagnostics.info(format_row(addr_str, instr.size, bytes_str, instr.original_text))
+            self.diagnostics.info("") # Add a blank line for spacing
+        finally:
+            self.diagnostics.end_batch()
 
-    def write_binary(self, program, output_file, profile):
-        """Writes the assembled machine code to a binary file."""
-        min_addr = float('inf')
-        max_addr = float('-inf')
-        for instr in program.instructions:
-            if instr.address is not None and instr.size > 0:
-                min_addr = min(min_addr, instr.address)
-                max_addr = max(max_addr, instr.address + instr.size - 1)
-
-        if min_addr != float('inf'):
-            # Convert to integers for calculation
-            min_addr_int = int(min_addr)
-            max_addr_int = int(max_addr)
-            mem_size = max_addr_int - min_addr_int + 1
-            # Get fill byte from profile, default to 0x00 if not specified
-            fill_byte_str = profile.cpu_info.get("fill_byte", "0x00")
-            try:
-                fill_byte = int(fill_byte_str, 0)
-            except ValueError:
-                fill_byte = 0x00  # Default to 0x00 on error
-            data = bytearray([fill_byte] * mem_size)  # Use the profile's fill byte
-            for instr in program.instructions:
-                if instr.machine_code and instr.address is not None:
-                    offset = instr.address - min_addr_int
-                    # Ensure offset is within bounds of data array
-                    if offset >= 0 and (offset + len(instr.machine_code)) <= len(data):
-                        data[offset:offset + len(instr.machine_code)] = instr.machine_code
-                    else:
-                        self.diagnostics.warning(instr.line_num, f"Instruction at ${instr.address:04X} ({instr.original_text}) falls outside calculated memory image range. Skipping.")
-            try:
-                # Ensure to output directory exists
-                output_dir = os.path.dirname(output_file)
-                if output_dir and not os.path.exists(output_dir):
-                    os.makedirs(output_dir)
-                with open(output_file, 'wb') as f:
-                    f.write(data)
-                self.diagnostics.info(f"Machine code written to {output_file} ({mem_size} bytes, from ${min_addr_int:04X} to ${max_addr_int:04X})")
-            except IOError as e:
-                self.diagnostics.error(None, f"Error writing binary to '{output_file}': {e}")
-                return False
-        else:
+    def write_binary(self, program, output_file, profile, output_format="bin"):
+        """
+        Writes the assembled machine code to a file.
+
+        output_format is "bin" for a flat memory image padded with the profile's
+        fill byte, or "hex" for Intel HEX records covering only emitted bytes.
+        """
+        placed = [instr for instr in program.instructions if instr.address is not None and instr.size > 0]
+
+        if not placed:
             self.diagnostics.info("No machine code generated to write.")
-        return True
\ No newline at end of file
+            return True
+
+        min_addr, max_addr, chunks = self._image_chunks(program, placed)
+        if output_format == "hex":
+            return self._write_intel_hex(chunks, output_file)
+
+        mem_size = max_addr - min_addr + 1
+        # Get fill byte from profile, default to 0x00 if not specified
+        fill_byte_str = profile.cpu_info.get("fill_byte", "0x00")
+        try:
+            fill_byte = int(fill_byte_str, 0)
+        except ValueError:
+            fill_byte = 0x00  # Default to 0x00 on error
+        data = bytearray([fill_byte]) * mem_size  # Use the profile's fill byte
+        populated = 0
+        for address, machine_code in chunks:
+            offset = address - min_addr
+            data[offset:offset + len(machine_code)] = machine_code
+            populated += len(machine_code)
+        try:
+            with self._open_output(output_file, 'wb') as f:
+                f.write(data)
+            self.diagnostics.info(f"Machine code written to {output_file} ({mem_size} bytes, from ${min_addr:04X} to ${max_addr:04X})")
+        except IOError as e:
+            self.diagnostics.error(None, f"Error writing binary to '{output_file}': {e}")
+            return False
+        if populated < mem_size * SPARSE_IMAGE_RATIO:
+            self.diagnostics.info(f"Only {populated} of {mem_size} bytes in the image hold code or data. Consider '--format hex' for sparse programs.")
+        return True
+
+    def _open_output(self, output_file, mode):
+        """Opens an output file, creating its directory first if needed."""
+        # Ensure to output directory exists
+        output_dir = os.path.dirname(output_file)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        return open(output_file, mode)
+
+    def _image_chunks(self, program, placed):
+        """
+        Returns (min_addr, max_addr, chunks) for the image spanned by the placed
+        instructions. chunks holds (address, machine_code) pairs in emission order;
+        code that falls outside the image is reported and skipped, so both output
+        formats validate a program the same way.
+        """
+        min_addr = min(instr.address for instr in placed)
+        max_addr = max(instr.address + instr.size for instr in placed) - 1
+        chunks = []
+        for instr in program.instructions:
+            if instr.machine_code and instr.address is not None:
+                if min_addr <= instr.address and instr.address + len(instr.machine_code) - 1 <= max_addr:
+                    chunks.append((instr.address, instr.machine_code))
+                else:
+                    self.diagnostics.warning(instr.line_num, f"Instruction at ${instr.address:04X} ({instr.original_text}) falls outside calculated memory image range. Skipping.")
+        return min_addr, max_addr, chunks
+
+    def _collect_segments(self, chunks):
+        """
+        Returns (start_address, bytearray) runs of emitted bytes, sorted by address.
+
+        Overlapping chunks (e.g. code .ORG'd back over earlier bytes) share a run,
+        and later chunks overwrite earlier ones, as in the flat binary image.
+        """
+        # Stable sort on the address alone, so ties keep their emission order
+        order = sorted(range(len(chunks)), key=lambda i: chunks[i][0])
+        runs = []  # [start, end, chunk indexes]
+        for i in order:
+            address, machine_code = chunks[i]
+            end = address + len(machine_code)
+            if runs and address <= runs[-1][1]:
+                runs[-1][1] = max(runs[-1][1], end)
+                runs[-1][2].append(i)
+            else:
+                runs.append([address, end, [i]])
+
+        segments = []
+        for start, end, members in runs:
+            data = bytearray(end - start)
+            # Write in emission order so the last write to an address wins
+            for i in sorted(members):
+                address, machine_code = chunks[i]
+                data[address - start:address - start + len(machine_code)] = machine_code
+            segments.append((start, data))
+        return segments
+
+    def _write_intel_hex(self, chunks, output_file):
+        """Writes only the emitted bytes as Intel HEX data records."""
+        segments = self._collect_segments(chunks)
+        try:
+            with self._open_output(output_file, 'w') as f:
+                f.writelines(f"{record}\n" for record in _intel_hex_records(segments))
+            total = sum(len(data) for _, data in segments)
+            self.diagnostics.info(f"Intel HEX written to {output_file} ({total} bytes in {len(segments)} segment(s))")
+        except IOError as e:
+            self.diagnostics.error(None, f"Error writing Intel HEX to '{output_file}': {e}")
+            return False
+        return True
+
+
+def _intel_hex_record(record_type, address, data=b""):
+    """Formats one Intel HEX record, including its two's-complement checksum."""
+    body = bytes([len(data), (address >> 8) & 0xFF, address & 0xFF, record_type]) + bytes(data)
+    checksum = -sum(body) & 0xFF
+    return f":{body.hex().upper()}{checksum:02X}"
+
+def _intel_hex_records(segments):
+    """Yields data records for each segment, an extended linear address record
+    whenever the upper 16 address bits change, and the end-of-file record."""
+    upper = 0
+    for start, data in segments:
+        offset = 0
+        while offset < len(data):
+            address = start + offset
+            if address >> 16 != upper:
+                upper = address >> 16
+                yield _intel_hex_record(0x04, 0, upper.to_bytes(2, "big"))
+            # Records never cross a 64K boundary
+            size = min(HEX_RECORD_SIZE, len(data) - offset, 0x10000 - (address & 0xFFFF))
+            yield _intel_hex_record(0x00, address, data[offset:offset + size])
+            offset += size
+    yield _intel_hex_record(0x01, 0)
@@ -1,13 +1,77 @@
 """
-An AST-based expression evaluator. It recursively walks the AST generated
-by the expression parser and computes the final value.
+A bytecode-based expression evaluator. Each AST generated by the expression
+parser is compiled once into a flat postfix program, which is then run by a
+small stack machine every time the expression needs a value.
 """
+import operator
+
 from core.expression_parser import BinOp, UnaryOp, Number, Symbol
 
+# --- Opcodes ---
+OP_CONST = 0    # push arg
+OP_SYMBOL = 1   # push value of symbol named arg
+OP_PC = 2       # push current address ('*')
+OP_UNARY = 3    # replace top of stack with arg(top)
+OP_BINARY = 4   # pop right, replace left with arg(left, right)
+
+UNARY_OPS = {
+    '-': operator.neg,
+    '<': lambda v: v & 0xFF,
+    '>': lambda v: (v >> 8) & 0xFF,
+}
+BINARY_OPS = {
+    '+': operator.add, '-': operator.sub, '*': operator.mul, '/': operator.floordiv,
+    '&': operator.and_, '|': operator.or_, '^': operator.xor,
+    '<<': operator.lshift, '>>': operator.rshift,
+}
+
+def compile_expression(node, line_num=None):
+    """
+    Compiles an expression AST into a list of (opcode, arg) tuples in postfix order.
+
+    Symbols are left late-bound (resolved by name at evaluation time) so that
+    forward references compile the same way as already-defined labels.
+    Expressions that reference no symbols are folded to a single constant.
+    """
+    code = []
+    _emit(node, code, line_num)
+    if len(code) > 1 and all(op != OP_SYMBOL and op != OP_PC for op, _ in code):
+        try:
+            return [(OP_CONST, _run(code, None, line_num, 0))]
+        except ArithmeticError:
+            pass  # Leave it unfolded so the error is raised on evaluation
+    return code
+
+def _emit(node, code, line_num):
+    """Appends the postfix program for a single node to code."""
+    kind = getattr(node, 'KIND', None)
+    if kind == Number.KIND:
+        code.append((OP_CONST, node.value))
+    elif kind == Symbol.KIND:
+        if node.name == '*':
+            code.append((OP_PC, None))
+        else:
+            code.append((OP_SYMBOL, node.name))
+    elif kind == UnaryOp.KIND and node.op in UNARY_OPS:
+        _emit(node.right, code, line_num)
+        code.append((OP_UNARY, UNARY_OPS[node.op]))
+    elif kind == BinOp.KIND and node.op in BINARY_OPS:
+        _emit(node.left, code, line_num)
+        _emit(node.right, code, line_num)
+        code.append((OP_BINARY, BINARY_OPS[node.op]))
+    elif isinstance(node, int):
+        code.append((OP_CONST, node))
+    else:
+        raise ValueError(f"Unknown AST node type: {type(node).__name__} on line {line_num}")
+
 def evaluate_expression(node, symbol_table, line_num, current_address: int = 0):
     """
-    Recursively evaluates an expression AST node.
-    
+    Evaluates an operand that may be an AST node, a raw integer, or None.
+
+    Use this where the operand is optional (e.g. an instruction's operand);
+    it returns None for None and raw integers unchanged, and otherwise
+    defers to evaluate_ast().
+
     Args:
         node: The AST node to evaluate
         symbol_table: Symbol table for resolving symbols
@@ -16,39 +80,50 @@ def evaluate_expression(node, symbol_table, line_num, current_address: int = 0):
     """
     if node is None:
         return None
-    
-    if type(node).__name__ == 'Number':
-        return node.value
-    if type(node).__name__ == 'Symbol':
-        if node.name == '*':
-            return current_address  # Return the current address
-        value = symbol_table.resolve(node.name)
-        if value is None:
-            raise ValueError(f"Undefined symbol '{node.name}' on line {line_num}")
-        return value
-    if isinstance(node, UnaryOp):
-        right = evaluate_expression(node.right, symbol_table, line_num, current_address)
-        if node.op == '-':
-            return -right
-        if node.op == '<':
-            return right & 0xFF
-        if node.op == '>':
-            return (right >> 8) & 0xFF
-    if isinstance(node, BinOp):
-        left = evaluate_expression(node.left, symbol_table, line_num, current_address)
-        right = evaluate_expression(node.right, symbol_table, line_num, current_address)
-        if node.op == '+': return left + right
-        if node.op == '-': return left - right
-        if node.op == '*': return left * right
-        if node.op == '/': return left // right
-        if node.op == '&': return left & right
-        if node.op == '|': return left | right
-        if node.op == '^': return left ^ right
-        if node.op == '<<': return left << right
-        if node.op == '>>': return left >> right
-    
+
     # This case handles a raw integer passed in (e.g. from an old part of the code)
     if isinstance(node, int):
         return node
-        
-    raise ValueError(f"Unknown AST node type: {type(node).__name__} on line {line_num}")
\ No newline at end of file
+
+    return evaluate_ast(node, symbol_table, line_num, current_address)
+
+def evaluate_ast(node, symbol_table, line_num, current_address: int = 0):
+    """
+    Evaluates an AST node produced by the expression parser.
+
+    Callers must pass a parsed AST, never None or a raw integer; directive
+    operands always satisfy this. The node is compiled on first use and the
+    program is cached on the node, so ASTs shared between instructions and
+    passes are only compiled once.
+    """
+    code = getattr(node, '_code', None)
+    if code is None:
+        code = compile_expression(node, line_num)
+        node._code = code
+
+    if len(code) == 1 and code[0][0] == OP_CONST:
+        return code[0][1]
+    return _run(code, symbol_table, line_num, current_address)
+
+def _run(code, symbol_table, line_num, current_address):
+    """Runs a compiled program on a value stack and returns the result."""
+    stack = []
+    push = stack.append
+    pop = stack.pop
+    resolve = symbol_table.resolve if symbol_table is not None else None
+    for op, arg in code:
+        if op == OP_CONST:
+            push(arg)
+        elif op == OP_SYMBOL:
+            value = resolve(arg)
+            if value is None:
+                raise ValueError(f"Undefined symbol '{arg}' on line {line_num}")
+            push(value)
+        elif op == OP_PC:
+            push(current_address)
+        elif op == OP_UNARY:
+            stack[-1] = arg(stack[-1])
+        else:
+            right = pop()
+            stack[-1] = arg(stack[-1], right)
+    return stack[0]
@@ -1,12 +1,18 @@
 """
-A robust expression parser using the Sly library.
+A small Pratt (top-down operator precedence) expression parser.
 It tokenizes an expression string and builds an Abstract Syntax Tree (AST).
 """
-from sly import Lexer, Parser
+import re
+import sys
+from functools import lru_cache
 
 # --- AST Node Classes ---
+# Each node class carries an integer KIND tag so consumers can dispatch
+# on a small int instead of on the node's type.
 class BinOp:
     """Binary Operator AST Node"""
+    KIND = 3
+
     def __init__(self, left, op, right):
         self.left = left
         self.op = op
@@ -14,144 +20,141 @@ class BinOp:
 
 class UnaryOp:
     """Unary Operator AST Node"""
+    KIND = 2
+
     def __init__(self, op, right):
         self.op = op
         self.right = right
 
 class Number:
     """Number literal AST Node"""
+    KIND = 0
+
     def __init__(self, value):
         self.value = value
 
 class Symbol:
     """Symbol/Identifier AST Node"""
+    KIND = 1
+
     def __init__(self, name):
         self.name = name
 
 # --- Lexer ---
-class ExpressionLexer(Lexer):
-    """Lexer for assembly expressions."""
-    tokens = { ID, HEX, BIN, OCT, DEC,
-               PLUS, MINUS, TIMES, DIVIDE,
-               AND, OR, XOR,
-               LSHIFT, RSHIFT,
-               LPAREN, RPAREN,
-               LT, GT }
-
-    ignore = ' \t'
-
-    # Tokens
-    ID = r'[a-zA-Z_][a-zA-Z0-9_]*'
-    HEX = r'\$[0-9a-fA-F]+'
-    BIN = r'%[01]+'
-    OCT = r'@[0-7]+'
-    DEC = r'\d+'
-
-    # Operators
-    PLUS = r'\+'
-    MINUS = r'-'
-    TIMES = r'\*'
-    DIVIDE = r'/'
-    AND = r'&'
-    OR = r'\|'
-    XOR = r'\^'
-    LSHIFT = r'<<'
-    RSHIFT = r'>>'
-    LPAREN = r'\('
-    RPAREN = r'\)'
-    LT = r'<'
-    GT = r'>'
-
-    def error(self, t):
-        raise ValueError(f"Illegal character '{t.value[0]}'")
-
-# --- Parser ---
-class ExpressionParser(Parser):
-    """Parser for assembly expressions. Builds an AST."""
-    tokens = ExpressionLexer.tokens
-
-    precedence = (
-        ('left', OR, XOR),
-        ('left', AND),
-        ('left', PLUS, MINUS),
-        ('left', TIMES, DIVIDE),
-        ('left', LSHIFT, RSHIFT),
-        ('right', UMINUS), # Unary minus
-        ('right', LT, GT), # Unary high/low byte
+# One alternation per token kind; blanks and tabs between tokens are skipped.
+_TOKEN_RE = re.compile(r"""
+    [ \t]*
+    (?:
+        \$(?P<HEX>[0-9a-fA-F]+)
+      | %(?P<BIN>[01]+)
+      | @(?P<OCT>[0-7]+)
+      | (?P<DEC>\d+)
+      | (?P<ID>[a-zA-Z_][a-zA-Z0-9_]*)
+      | (?P<OP><<|>>|[-+*/&|^()<>])
     )
+""", re.VERBOSE)
+
+_NUMBER_BASES = {"HEX": 16, "BIN": 2, "OCT": 8, "DEC": 10}
+
+def tokenize(src: str) -> list[tuple[str, object]]:
+    """
+    Splits an expression into (kind, value) tokens.
+
+    Numeric literals are converted while tokenizing, so kind is "NUM" with an
+    int value, "ID" with the upper-cased name, or "OP" with the operator text.
+    """
+    tokens = []
+    pos = 0
+    end = len(src.rstrip(' \t'))
+    while pos < end:
+        match = _TOKEN_RE.match(src, pos)
+        if not match:
+            bad = src[pos:].lstrip(' \t')[0]
+            raise ValueError(f"Illegal character '{bad}'")
+        kind = match.lastgroup
+        text = match.group(kind)
+        if kind == "OP":
+            tokens.append(("OP", text))
+        elif kind == "ID":
+            tokens.append(("ID", sys.intern(text.upper())))
+        else:
+            tokens.append(("NUM", int(text, _NUMBER_BASES[kind])))
+        pos = match.end()
+    return tokens
 
-    @_('expr PLUS expr')
-    def expr(self, p):
-        return BinOp(p.expr0, p.PLUS, p.expr1)
-
-    @_('expr MINUS expr')
-    def expr(self, p):
-        return BinOp(p.expr0, p.MINUS, p.expr1)
-
-    @_('expr TIMES expr')
-    def expr(self, p):
-        return BinOp(p.expr0, p.TIMES, p.expr1)
-
-    @_('expr DIVIDE expr')
-    def expr(self, p):
-        return BinOp(p.expr0, p.DIVIDE, p.expr1)
-
-    @_('expr AND expr')
-    def expr(self, p):
-        return BinOp(p.expr0, p.AND, p.expr1)
-
-    @_('expr OR expr')
-    def expr(self, p):
-        return BinOp(p.expr0, p.OR, p.expr1)
-
-    @_('expr XOR expr')
-    def expr(self, p):
-        return BinOp(p.expr0, p.XOR, p.expr1)
-
-    @_('expr LSHIFT expr')
-    def expr(self, p):
-        return BinOp(p.expr0, p.LSHIFT, p.expr1)
-
-    @_('expr RSHIFT expr')
-    def expr(self, p):
-        return BinOp(p.expr0, p.RSHIFT, p.expr1)
-
-    @_('MINUS expr %prec UMINUS')
-    def expr(self, p):
-        return UnaryOp(p.MINUS, p.expr)
-
-    @_('LT expr')
-    def expr(self, p):
-        return UnaryOp(p.LT, p.expr)
-
-    @_('GT expr')
-    def expr(self, p):
-        return UnaryOp(p.GT, p.expr)
-
-    @_('LPAREN expr RPAREN')
-    def expr(self, p):
-        return p.expr
-
-    @_('term')
-    def expr(self, p):
-        return p.term
-
-    @_('HEX')
-    def term(self, p):
-        return Number(int(p.HEX[1:], 16))
-
-    @_('BIN')
-    def term(self, p):
-        return Number(int(p.BIN[1:], 2))
-
-    @_('OCT')
-    def term(self, p):
-        return Number(int(p.OCT[1:], 8))
-
-    @_('DEC')
-    def term(self, p):
-        return Number(int(p.DEC))
-
-    @_('ID')
-    def term(self, p):
-        return Symbol(p.ID.upper())
\ No newline at end of file
+# --- Parser ---
+# Binding powers, lowest to highest. All binary operators are left-associative.
+_BINARY_PRECEDENCE = {
+    '|': 10, '^': 10,
+    '&': 20,
+    '+': 30, '-': 30,
+    '*': 40, '/': 40,
+    '<<': 50, '>>': 50,
+}
+_UMINUS_PRECEDENCE = 60   # Unary minus
+_BYTE_PRECEDENCE = 70     # Unary low/high byte ('<' and '>')
+
+class ExpressionParser:
+    """Pratt parser for assembly expressions. Builds an AST."""
+
+    def parse(self, tokens: list[tuple[str, object]]):
+        """Parses a full token list into an AST, rejecting trailing tokens."""
+        self._tokens = tokens
+        self._pos = 0
+        node = self._expr(0)
+        if self._pos < len(tokens):
+            raise ValueError(f"Syntax error at '{tokens[self._pos][1]}'")
+        return node
+
+    def _next(self):
+        if self._pos >= len(self._tokens):
+            raise ValueError("Unexpected end of expression")
+        token = self._tokens[self._pos]
+        self._pos += 1
+        return token
+
+    def _expr(self, rbp: int):
+        """Parses an expression whose operators all bind tighter than rbp."""
+        left = self._prefix()
+        tokens = self._tokens
+        while self._pos < len(tokens):
+            kind, op = tokens[self._pos]
+            lbp = _BINARY_PRECEDENCE.get(op, 0) if kind == "OP" else 0
+            if lbp <= rbp:
+                break
+            self._pos += 1
+            left = BinOp(left, op, self._expr(lbp))
+        return left
+
+    def _prefix(self):
+        """Parses a term, a parenthesized expression, or a unary operator application."""
+        kind, value = self._next()
+        if kind == "NUM":
+            return Number(value)
+        if kind == "ID":
+            return Symbol(value)
+        if value == '-':
+            return UnaryOp(value, self._expr(_UMINUS_PRECEDENCE))
+        if value in ('<', '>'):
+            return UnaryOp(value, self._expr(_BYTE_PRECEDENCE))
+        if value == '(':
+            node = self._expr(0)
+            if self._next() != ("OP", ')'):
+                raise ValueError("Expected ')'")
+            return node
+        raise ValueError(f"Syntax error at '{value}'")
+
+
+# --- Shared parser entry point ---
+_parser = ExpressionParser()
+
+@lru_cache(maxsize=None)
+def parse_expression(src: str):
+    """
+    Parses an expression string into an AST, memoized by source text.
+
+    Identical operand strings (e.g. a label referenced many times) share one
+    AST, so each distinct expression is only tokenized and parsed once. The
+    returned nodes are treated as immutable by the rest of the assembler.
+    """
+    return _parser.parse(tokenize(src))
@@ -1,7 +1,14 @@
-from typing import Optional, List, Any
+from typing import Optional, Any
 from core.diagnostics import Diagnostics
 
 class Instruction:
+    # Fixed attribute layout: every pass reads these fields once per line, and
+    # slots make those reads cheaper and the per-line objects smaller.
+    __slots__ = (
+        "line_num", "original_text", "label", "mnemonic", "operand_str", "mode",
+        "operand_value", "directive", "address", "size", "machine_code",
+    )
+
     def __init__(self, line_num: int, original_text: str = ""):
         self.line_num: int = line_num
         self.original_text: str = original_text
@@ -13,7 +20,7 @@ class Instruction:
         self.directive: Optional[str] = None
         self.address: Optional[int] = None
         self.size: int = 0
-        self.machine_code: Optional[List[int]] = None
+        self.machine_code: Optional[bytes] = None
 
     def to_dict(self):
         """Serializes the instruction's state to a dictionary for debugging."""
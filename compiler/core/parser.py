@@ -1,11 +1,12 @@
 import re
+import sys
 from collections import namedtuple
 
 from cpu_profile_base import ConfigCPUProfile
 from core.diagnostics import Diagnostics
 from core.instruction import Instruction
 from core.program import Program
-from core.expression_parser import ExpressionLexer, ExpressionParser
+from core.expression_parser import parse_expression
 
 ParsedLine = namedtuple('ParsedLine', ['label', 'mnemonic', 'operand_str'])
 
@@ -40,7 +41,7 @@ class _LineParser:
         comment_index = line.find(';')
         if comment_index != -1:
             stripped = line[:comment_index].rstrip()
-            logger.debug(f"Stripped comment, result: '{stripped}'")
+            logger.debug("Stripped comment, result: '%s'", stripped)
             return stripped
         return line.rstrip()
 
@@ -48,9 +49,10 @@ class _LineParser:
         """Extracts a colon-terminated label from the text, if present."""
         if ':' in text:
             label_part, rest = text.split(':', 1)
-            label = label_part.strip().upper()
-            logger.debug(f"Extracted label: '{label}', remaining text: '{rest.strip()}'")
-            return label, rest.strip()
+            label = sys.intern(label_part.strip().upper())
+            rest = rest.strip()
+            logger.debug("Extracted label: '%s', remaining text: '%s'", label, rest)
+            return label, rest
         return None, text
 
     def _extract_mnemonic_and_operand(self, text: str, existing_label: str | None, logger) -> ParsedLine:
@@ -62,19 +64,20 @@ class _LineParser:
         # This allows directives like EQU to be written as "LABEL EQU $1234"
         if existing_label is None and len(parts) >= 3:
             # This could be "LABEL DIRECTIVE VALUE" format
-            potential_label = parts[0].upper()
-            potential_directive = parts[1].upper()
+            potential_label = sys.intern(parts[0].upper())
+            potential_directive = sys.intern(parts[1].upper())
             # Check if the second part is a known directive that supports implicit labels
             # For now, we'll handle EQU specifically, but this could be profile-driven
             if potential_directive == "EQU":
                 label = potential_label
                 mnemonic = potential_directive
                 operand_str = parts[2]
-                logger.debug(f"Parsed directive with implicit label: '{label}' = '{operand_str}'")
+                logger.debug("Parsed directive with implicit label: '%s' = '%s'", label, operand_str)
                 return ParsedLine(label, mnemonic, operand_str)
         
         # Standard parsing: MNEMONIC [OPERAND]
-        mnemonic = parts[0].upper()
+        # Names are interned so later dict lookups against profile and symbol keys compare by identity
+        mnemonic = sys.intern(parts[0].upper())
         operand_str = parts[1] if len(parts) > 1 else None
         return ParsedLine(existing_label, mnemonic, operand_str)
 
@@ -89,9 +92,6 @@ class Parser:
         self.cpu_profile = cpu_profile
         self.diagnostics = diagnostics
         self.logger = diagnostics.logger
-        # Instantiate the expression lexer and parser
-        self._exp_lexer = ExpressionLexer()
-        self._exp_parser = ExpressionParser()
         self._line_parser = _LineParser()
 
     def _validate_syntax(self, instruction: Instruction):
@@ -137,10 +137,10 @@ class Parser:
         values = []
         for p in parts:
             try:
-                ast = self._exp_parser.parse(self._exp_lexer.tokenize(p))
+                ast = parse_expression(p)
                 values.append(ast)
             except ValueError as e:
-                self.logger.debug(f"Sly expression parser failed for operand '{p}'", exc_info=True)
+                self.logger.debug("Expression parser failed for operand '%s'", p, exc_info=True)
                 self.diagnostics.error(None, f"In expression '{p}': {e}")
                 values.append(None) # Append None to indicate failure
         return values
@@ -169,18 +169,18 @@ class Parser:
 
     def parse_line(self, line, line_num):
         original_text = line.rstrip()
-        self.logger.debug(f"--- Parsing line {line_num}: '{original_text}' ---")
+        self.logger.debug("--- Parsing line %d: '%s' ---", line_num, original_text)
         try:
             parsed_line = self._line_parser.parse(original_text, self.logger)
         except ValueError as e:
-            self.logger.debug(f"Line parser failed for line: '{original_text}'", exc_info=True)
+            self.logger.debug("Line parser failed for line: '%s'", original_text, exc_info=True)
             self.diagnostics.error(line_num, str(e))
             return None
 
         if not parsed_line:
             return None
 
-        self.logger.debug(f"Line parser result: {parsed_line}")
+        self.logger.debug("Line parser result: %s", parsed_line)
         instr = Instruction(line_num, original_text)
         instr.label = parsed_line.label
         instr.mnemonic = parsed_line.mnemonic
@@ -221,5 +221,5 @@ class Parser:
                     elif instr:
                         program.add_instruction(instr)
         except FileNotFoundError:
-            self.logger.debug(f"File not found exception for path: '{source_file_path}'", exc_info=True)
+            self.logger.debug("File not found exception for path: '%s'", source_file_path, exc_info=True)
             self.diagnostics.error(None, f"Source file not found at '{source_file_path}'")
\ No newline at end of file
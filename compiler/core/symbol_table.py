@@ -4,6 +4,9 @@ class SymbolTable:
     def __init__(self, diagnostics: 'Diagnostics'):
         self._symbols = {}
         self.diagnostics = diagnostics
+        # resolve() runs for every symbol reference in every pass, so bind it
+        # directly to the dict's C-level get instead of a Python-level wrapper.
+        self.resolve = self._symbols.get
 
     def add(self, label, address, line_num):
         """Adds a symbol to the table. Returns False on duplicate."""
@@ -13,10 +16,6 @@ class SymbolTable:
         self._symbols[label] = address
         return True
 
-    def resolve(self, symbol):
-        """Resolves a symbol to its address. Returns None if not found."""
-        return self._symbols.get(symbol)
-
     def get_printable(self):
         """Returns a dictionary formatted for printing."""
         return {k: f"${v:04X}" for k, v in self._symbols.items()}
\ No newline at end of file
@@ -3,7 +3,13 @@ from abc import ABC, abstractmethod
 from typing import Any, TYPE_CHECKING
 import os
 import re
+import struct
+import sys
+from collections import OrderedDict
 from enum import Enum
+from functools import cached_property, lru_cache
+
+from core.expression_evaluator import evaluate_ast, evaluate_expression
 
 if TYPE_CHECKING:
     from parser import Parser
@@ -23,6 +29,102 @@ def create_addressing_mode_enum(cpu_name: str, addressing_modes: dict):
     return Enum(enum_name, enum_members)
 
 
+# Translation table deleting the addressing-mode syntax characters from an operand
+_OPERAND_SYNTAX_CHARS = str.maketrans("", "", "#()")
+
+# Parsed profile data keyed by real path, with the (mtime_ns, size) stamp it
+# was read at, least recently used first. Profiles are only read after loading
+# (the opcode table conversion is idempotent), so instances can share one dict.
+_PROFILE_CACHE: OrderedDict[str, tuple[tuple[int, int], dict]] = OrderedDict()
+_PROFILE_CACHE_SIZE = 32
+
+
+def _file_stamp(f) -> tuple[int, int] | None:
+    """Return (mtime_ns, size) for an open file, or None if it cannot be stat'ed."""
+    try:
+        st = os.fstat(f.fileno())
+    except (AttributeError, TypeError, ValueError, OSError):
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _pack_words(values: list[int], big_endian: bool = False) -> bytes:
+    """Pack 16-bit values into bytes with a single struct call; values must already be in range."""
+    fmt = f"{'>' if big_endian else '<'}{len(values)}H"
+    return struct.pack(fmt, *values)
+
+
+def _pool_dict(pool: dict, d: dict) -> dict:
+    """Return the pooled dict equal to d, adding d to the pool if it is the first."""
+    try:
+        key = frozenset(d.items())
+    except TypeError:  # Unhashable values cannot be pooled
+        return d
+    return pool.setdefault(key, d)
+
+
+# Generic validation rule compilers. Each binds a rule's fields once and returns
+# a check(mnemonic, mode_name, operand_value) that gives the formatted diagnostic
+# message when the rule is violated, or None when the instruction passes.
+def _compile_mode_is(rule):
+    modes = rule.get("modes", [])
+    message = rule.get("message", "")
+    def check(mnemonic, mode_name, operand_value):
+        if mode_name in modes:
+            return message.format(mnemonic=mnemonic, mode=mode_name)
+        return None
+    return check
+
+
+def _compile_mode_is_not(rule):
+    modes = rule.get("modes", [])
+    message = rule.get("message", "")
+    valid_modes = ", ".join(modes)
+    def check(mnemonic, mode_name, operand_value):
+        if mode_name not in modes:
+            return message.format(mnemonic=mnemonic, mode=mode_name, valid_modes=valid_modes)
+        return None
+    return check
+
+
+def _compile_operand_out_of_range(rule):
+    exceptions = rule.get("exceptions", [])
+    min_val = rule.get("min_value", 0)
+    max_val = rule.get("max_value", 255)
+    message = rule.get("message", "")
+    def check(mnemonic, mode_name, operand_value):
+        # Skip the rule for exception mnemonics
+        if not isinstance(operand_value, int) or mnemonic in exceptions:
+            return None
+        if not (min_val <= operand_value <= max_val):
+            return message.format(mnemonic=mnemonic, value=operand_value, min_value=min_val, max_value=max_val)
+        return None
+    return check
+
+
+def _compile_register_used(rule):
+    # For register-specific validation (e.g., Y register warnings)
+    register = rule.get("register", "")
+    message = rule.get("message", "")
+    def check(mnemonic, mode_name, operand_value):
+        if hasattr(operand_value, 'register') and operand_value.register == register:
+            return message.format(mnemonic=mnemonic, register=register)
+        return None
+    return check
+
+
+# Rule type -> (compiler, is_error); warnings never stop validation
+_VALIDATION_RULE_COMPILERS = {
+    "error_if_mode_is": (_compile_mode_is, True),
+    "error_if_mode_is_not": (_compile_mode_is_not, True),
+    "warning_if_mode_is": (_compile_mode_is, False),
+    "warning_if_mode_is_not": (_compile_mode_is_not, False),
+    "error_if_operand_out_of_range": (_compile_operand_out_of_range, True),
+    "warning_if_operand_out_of_range": (_compile_operand_out_of_range, False),
+    "error_if_register_used": (_compile_register_used, True),
+    "warning_if_register_used": (_compile_register_used, False),
+}
+
 class ConfigCPUProfile:
     """Configuration-driven CPU Profile that loads configuration from YAML files."""
     
@@ -31,6 +133,17 @@ class ConfigCPUProfile:
         self._profile_file_path = profile_file_path
         self._load_profile(profile_file_path)
         self._create_addressing_mode_enum()
+        self._build_opcode_table()
+        self._compile_addressing_mode_patterns()
+        # Operand matching is pure once the patterns are built, and source files
+        # repeat the same operands, so memoize it per profile instance
+        self._match_addressing_mode = lru_cache(maxsize=4096)(self._match_addressing_mode)
+        self._build_rule_tables()
+        # Second-pass directive encoders keyed by directive name
+        self._directive_encoders = {
+            ".BYTE": self._encode_byte_directive,
+            ".WORD": self._encode_word_directive,
+        }
     
     def _load_profile(self, profile_file_path: str):
         """Load CPU profile from YAML file."""
@@ -39,12 +152,28 @@ class ConfigCPUProfile:
             
             with open(profile_file_path, 'r') as f:
                 if file_ext == '.yaml' or file_ext == '.yml':
+                    # Reuse the parsed data if the file is unchanged since it was last loaded
+                    cache_key = os.path.realpath(profile_file_path)
+                    stamp = _file_stamp(f)
+                    cached = _PROFILE_CACHE.get(cache_key)
+                    if stamp is not None and cached is not None and cached[0] == stamp:
+                        _PROFILE_CACHE.move_to_end(cache_key)
+                        self._profile_data = cached[1]
+                        return
+                    
                     # Lazy-load YAML library only when needed
                     try:
                         import yaml
-                        self._profile_data = yaml.safe_load(f)
+                        # Prefer the libyaml-backed loader when PyYAML was built with it
+                        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+                        self._profile_data = yaml.load(f, Loader=loader)
                     except ImportError:
                         raise ImportError("To load '.yaml' profiles, please 'pip install PyYAML'")
+                    if stamp is not None:
+                        _PROFILE_CACHE[cache_key] = (stamp, self._profile_data)
+                        _PROFILE_CACHE.move_to_end(cache_key)
+                        if len(_PROFILE_CACHE) > _PROFILE_CACHE_SIZE:
+                            _PROFILE_CACHE.popitem(last=False)
                         
                 else:
                     raise ValueError(f"Unsupported file format: {file_ext}. Only YAML files (.yaml, .yml) are supported.")
@@ -59,29 +188,176 @@ class ConfigCPUProfile:
         cpu_name = self.cpu_info.get("name", "CPU")
         addressing_modes = self._profile_data["addressing_modes"]
         self.AddressingMode = create_addressing_mode_enum(cpu_name, addressing_modes)
-    
-    @property
+        # Reverse lookup for get_addressing_mode_name(): enum members and raw
+        # integer values both map to the mode name. Reversed so that, as with
+        # a linear scan, the first name wins when two modes share a value.
+        self._mode_names = {value: name for name, value in reversed(list(addressing_modes.items()))}
+        for member in self.AddressingMode:
+            self._mode_names[member] = member.name.replace('_', ' ')
+        # Memo for get_addressing_mode_enum(), filled on first lookup of each spelling
+        self._mode_enums = {}
+        # Modes the parser and encoder refer to by name on every instruction
+        self._mode_inherent = self.get_addressing_mode_enum("INHERENT")
+        self._mode_implied = self.get_addressing_mode_enum("IMPLIED")
+        self._mode_indexed = self.get_addressing_mode_enum("INDEXED")
+        self._mode_relative = self.get_addressing_mode_enum("RELATIVE")
+    
+    def _build_opcode_table(self):
+        """Flatten opcodes into a single (mnemonic, mode name) -> details table with integer opcodes."""
+        self._opcode_table = {}
+        # Identical cycle-count dicts (e.g. {"base": 2}) are shared across rows
+        cycle_pool = {}
+        for mnemonic, modes in self.opcodes.items():
+            mnemonic = sys.intern(mnemonic)
+            for mode_name, opcode_details in modes.items():
+                if isinstance(opcode_details, list) and len(opcode_details) > 0:
+                    opcode_details[0] = self._convert_opcode_to_int(opcode_details[0])
+                    if len(opcode_details) > 2 and isinstance(opcode_details[2], dict):
+                        opcode_details[2] = _pool_dict(cycle_pool, opcode_details[2])
+                self._opcode_table[(mnemonic, sys.intern(mode_name))] = opcode_details
+        
+        # (opcode, operand size) pairs keyed by (mnemonic, mode enum member), so encoding
+        # can skip the enum -> name conversion and only carries the two fields it reads.
+        # Members map through get_addressing_mode_name().
+        members_by_name = {self._mode_names[member]: member for member in self.AddressingMode}
+        self._encode_table = {}
+        for (mnemonic, mode_name), opcode_details in self._opcode_table.items():
+            member = members_by_name.get(mode_name)
+            if member is not None and isinstance(opcode_details, list) and len(opcode_details) == 4:
+                self._encode_table[(mnemonic, member)] = (opcode_details[0], opcode_details[1])
+        self._big_endian = self.cpu_info.get("endianness", "little") != "little"
+        # Packs an opcode followed by a 16-bit operand in the CPU's byte order
+        self._pack_opcode_word = struct.Struct(">BH" if self._big_endian else "<BH").pack
+    
+    def _compile_addressing_mode_patterns(self):
+        """Compile addressing mode regexes once, pairing each with its resolved mode enum."""
+        self._compiled_patterns = []
+        for pattern_info in self.addressing_mode_patterns:
+            regex_flags = 0
+            if "IGNORECASE" in pattern_info.get("flags", []):
+                regex_flags |= re.IGNORECASE
+            try:
+                compiled_pattern = re.compile(pattern_info["pattern"], regex_flags)
+            except re.error as e:
+                raise ValueError(f"Invalid addressing mode pattern '{pattern_info['pattern']}': {e}")
+            mode = self.get_addressing_mode_enum(pattern_info["mode"])
+            self._compiled_patterns.append((compiled_pattern.match, mode, pattern_info))
+        self._build_combined_pattern()
+    
+    def _build_combined_pattern(self):
+        """
+        Merge all addressing mode patterns into one alternation of named groups so
+        an operand is matched with a single regex call. Alternatives are tried in
+        profile order, so the first matching pattern still wins. Group indexes
+        from the profile are rebased onto the combined pattern's numbering.
+        Leaves self._combined_match as None (per-pattern matching) if a pattern
+        relies on its own group numbering or inline flags.
+        """
+        self._combined_match = None
+        self._combined_alternatives = {}
+        alternatives = []
+        for i, pattern_info in enumerate(self.addressing_mode_patterns):
+            pattern = pattern_info["pattern"]
+            if re.search(r"\\[1-9]|\(\?P=|\(\?[aiLmsux]+\)", pattern):
+                return
+            if "IGNORECASE" in pattern_info.get("flags", []):
+                pattern = f"(?i:{pattern})"
+            alternatives.append(f"(?P<_mode{i}>{pattern})")
+        try:
+            combined = re.compile("|".join(alternatives))
+        except re.error:
+            return
+        
+        for i, (_, mode, pattern_info) in enumerate(self._compiled_patterns):
+            name = f"_mode{i}"
+            group_idx = pattern_info.get("group_index")
+            if group_idx is not None:
+                # Group 0 (the whole match) is the named group itself
+                group_idx += combined.groupindex[name]
+            self._combined_alternatives[name] = (mode, group_idx, pattern_info["mode"])
+        self._combined_match = combined.match
+    
+    def _build_rule_tables(self):
+        """Flatten post-processing and validation rules into per-mnemonic/per-mode lookups."""
+        post_processing = self._profile_data.get("post_processing", {})
+        
+        # Branch mnemonics and the mode they are forced into (None if not forced)
+        branch_rules = post_processing.get("branch_instructions", {})
+        force_mode = branch_rules.get("force_mode")
+        self._branch_force_mnemonics = frozenset(branch_rules.get("mnemonics", []))
+        self._branch_force_mode = self.get_addressing_mode_enum(force_mode) if force_mode else None
+        
+        # Automatic mode conversion rules grouped by source mode name, in profile order,
+        # as (threshold, target mode name, target mode enum, has condition) tuples
+        self._auto_conversions = {}
+        for rule in post_processing.get("automatic_mode_conversion", []):
+            self._auto_conversions.setdefault(rule["from_mode"], []).append((
+                rule.get("threshold"),
+                rule["to_mode"],
+                self.get_addressing_mode_enum(rule["to_mode"]),
+                bool(rule.get("condition")),
+            ))
+        self._has_post_processing = self._branch_force_mode is not None or bool(self._auto_conversions)
+        
+        # Generic validation rules applicable to each mnemonic, in profile order.
+        # Rules without a mnemonic list apply to every mnemonic.
+        self._global_validation_rules = ()
+        self._validation_rules_by_mnemonic = {}
+        validation_rules = self.validation_rules
+        # Legacy (dict-format) rule sections, all empty for generic rule lists
+        legacy_rules = validation_rules if isinstance(validation_rules, dict) else {}
+        self._accumulator_only = legacy_rules.get("accumulator_only", {})
+        self._inherent_only = legacy_rules.get("inherent_only", {})
+        self._branch_valid_modes = legacy_rules.get("branch_valid_modes", {})
+        self._inherent_warnings = legacy_rules.get("inherent_warnings", {})
+        self._optimization_hints = legacy_rules.get("optimization_hints", {})
+        # Each rule is compiled once into a (check, is_error) pair; unknown types never fire.
+        if isinstance(validation_rules, list):
+            global_rules = []
+            for rule in validation_rules:
+                entry = _VALIDATION_RULE_COMPILERS.get(rule.get("type"))
+                if entry is None:
+                    continue
+                compile_rule, is_error = entry
+                compiled = (compile_rule(rule), is_error)
+                mnemonics = rule.get("mnemonics", [])
+                if not mnemonics:
+                    global_rules.append(compiled)
+                    for rules in self._validation_rules_by_mnemonic.values():
+                        rules.append(compiled)
+                    continue
+                for mnemonic in mnemonics:
+                    rules = self._validation_rules_by_mnemonic.get(mnemonic)
+                    if rules is None:
+                        rules = self._validation_rules_by_mnemonic[mnemonic] = list(global_rules)
+                    if not rules or rules[-1] is not compiled:
+                        rules.append(compiled)
+            self._global_validation_rules = tuple(global_rules)
+    
+    # Profile sections never change after loading, so each is read from
+    # _profile_data once and then served from the instance dict.
+    @cached_property
     def cpu_info(self) -> dict:
         return self._profile_data["cpu_info"]
     
-    @property
+    @cached_property
     def opcodes(self) -> dict[str, dict[Any, list[Any]]]:
         return self._profile_data["opcodes"]
     
-    @property
-    def branch_mnemonics(self) -> set[str]:
-        return set(self._profile_data["branch_mnemonics"])
+    @cached_property
+    def branch_mnemonics(self) -> frozenset[str]:
+        return frozenset(self._profile_data["branch_mnemonics"])
     
-    @property
+    @cached_property
     def addressing_modes(self) -> dict[str, int]:
         """Legacy property for backward compatibility."""
         return self._profile_data["addressing_modes"]
     
-    @property
+    @cached_property
     def addressing_mode_patterns(self) -> list[dict]:
         return self._profile_data["addressing_mode_patterns"]
     
-    @property
+    @cached_property
     def directives(self) -> dict:
         return self._profile_data.get("directives", {})
     
@@ -95,31 +371,40 @@ class ConfigCPUProfile:
             return False
         return mnemonic.upper() in self.directives
     
-    @property
+    @cached_property
     def validation_rules(self) -> dict:
         return self._profile_data.get("validation_rules", {})
     
     def get_addressing_mode_enum(self, mode_name: str) -> Any:
         """Get enum value for addressing mode name."""
+        try:
+            return self._mode_enums[mode_name]
+        except KeyError:
+            pass
+        
         # Convert mode name to enum member name
         member_name = mode_name.upper().replace(' ', '_')
         try:
-            return getattr(self.AddressingMode, member_name)
+            mode = getattr(self.AddressingMode, member_name)
         except AttributeError:
             # Fallback to dictionary for backward compatibility
-            return self.addressing_modes.get(mode_name)
+            mode = self.addressing_modes.get(mode_name)
+        self._mode_enums[mode_name] = mode
+        return mode
     
     def get_addressing_mode_name(self, mode_enum: Any) -> str | None:
         """Get addressing mode name from enum value."""
+        try:
+            return self._mode_names[mode_enum]
+        except (KeyError, TypeError):
+            pass
+        
         # If it's an Enum member, get its name
         if hasattr(mode_enum, 'name'):
             return mode_enum.name.replace('_', ' ')
         
         # If it's an integer value, look up in dictionary
         if isinstance(mode_enum, int):
-            for name, value in self.addressing_modes.items():
-                if value == mode_enum:
-                    return name
             return None
         
         # Fallback: try to convert to string
@@ -127,39 +412,31 @@ class ConfigCPUProfile:
     
     def parse_addressing_mode(self, operand_str: str) -> tuple[Any, Any]:
         """Parse addressing mode using YAML patterns (optimized for 8-bit CPUs)."""
-        operand_str = operand_str.strip().upper()
+        return self._match_addressing_mode(operand_str.strip().upper())
+    
+    def _match_addressing_mode(self, operand_str: str) -> tuple[Any, Any]:
+        """Match an operand that is already stripped and upper-cased."""
         if not operand_str:
-            return (self.get_addressing_mode_enum("INHERENT"), None)
+            return (self._mode_inherent, None)
+        
+        if self._combined_match is not None:
+            match = self._combined_match(operand_str)
+            if match:
+                mode, group_idx, mode_name = self._combined_alternatives[match.lastgroup]
+                return (mode, self._extract_value(match, group_idx, mode_name, operand_str))
+            raise ValueError(f"Invalid operand: {operand_str}")
         
         # Try each pattern until we find a match
-        for pattern_info in self.addressing_mode_patterns:
-            match = self._match_pattern(operand_str, pattern_info)
+        for match_pattern, mode, pattern_info in self._compiled_patterns:
+            match = match_pattern(operand_str)
             if match:
-                mode_name = pattern_info["mode"]
-                mode = self.get_addressing_mode_enum(mode_name)
-                value = self._extract_value(match, pattern_info, operand_str)
+                value = self._extract_value(match, pattern_info.get("group_index"), pattern_info["mode"], operand_str)
                 return (mode, value)
         
         raise ValueError(f"Invalid operand: {operand_str}")
     
-    def _match_pattern(self, operand_str: str, pattern_info: dict) -> re.Match | None:
-        """Match operand against a single pattern."""
-        pattern = pattern_info["pattern"]
-        flags = pattern_info.get("flags", [])
-        
-        # Compile regex with appropriate flags
-        regex_flags = 0
-        if "IGNORECASE" in flags:
-            regex_flags |= re.IGNORECASE
-        
-        compiled_pattern = re.compile(pattern, regex_flags)
-        return compiled_pattern.match(operand_str)
-    
-    def _extract_value(self, match: re.Match, pattern_info: dict, original_operand: str) -> Any:
+    def _extract_value(self, match: re.Match, group_idx: int | None, mode_name: str, original_operand: str) -> Any:
         """Extract and convert value from regex match (8-bit CPU optimized)."""
-        mode_name = pattern_info["mode"]
-        group_idx = pattern_info.get("group_index")
-        
         # Handle accumulator modes (no value needed)
         if mode_name in ["ACCUMULATOR", "ACCUMULATOR_A", "ACCUMULATOR_B"]:
             return None
@@ -221,8 +498,7 @@ class ConfigCPUProfile:
     def _extract_from_operand(self, operand_str: str, mode_name: str) -> int | str | None:
         """Extract value from operand string based on addressing mode."""
         # Remove addressing mode syntax characters
-        clean_str = operand_str
-        clean_str = re.sub(r'[#()]', '', clean_str)  # Remove #, (, )
+        clean_str = operand_str.translate(_OPERAND_SYNTAX_CHARS)  # Remove #, (, )
         
         # For indexed addressing, extract base address
         if mode_name == "INDEXED":
@@ -230,7 +506,9 @@ class ConfigCPUProfile:
             clean_str = parts[0] if parts else clean_str
         
         # Remove register references
-        clean_str = re.sub(r'[XYAB]$', '', clean_str.strip())
+        clean_str = clean_str.strip()
+        if clean_str.endswith(("X", "Y", "A", "B")):
+            clean_str = clean_str[:-1]
         
         return self._convert_numeric_value(clean_str)
     
@@ -241,22 +519,24 @@ class ConfigCPUProfile:
         
         if not operand_str:
             # Check if this mnemonic is an inherent instruction
-            mode, _ = self.parse_addressing_mode(mnemonic)
+            # Mnemonics arrive upper-cased and stripped from the line parser
+            mode, _ = self._match_addressing_mode(mnemonic)
             if mode is not None:
                 instruction.mode = mode
             else:
-                instruction.mode = self.get_addressing_mode_enum("IMPLIED")
+                instruction.mode = self._mode_implied
             return
 
         expression_str = operand_str
         if operand_str.startswith('#'):
             expression_str = operand_str[1:]
 
-        mode, extracted_value = self.parse_addressing_mode(operand_str)
+        # The line parser splits on whitespace, so the operand only needs upper-casing
+        mode, extracted_value = self._match_addressing_mode(operand_str.upper())
         if mode:
             instruction.mode = mode
             # For indexed addressing, use the extracted value (before ",X")
-            if mode == self.get_addressing_mode_enum("INDEXED") and extracted_value:
+            if mode == self._mode_indexed and extracted_value:
                 instruction.operand_value = parser.parse_operand_list(extracted_value)[0]
             else:
                 instruction.operand_value = parser.parse_operand_list(expression_str)[0]
@@ -268,6 +548,9 @@ class ConfigCPUProfile:
     
     def _apply_post_processing_rules(self, instruction):
         """Apply CPU-specific post-processing rules from YAML configuration."""
+        if not self._has_post_processing:
+            return
+        
         mnemonic = instruction.mnemonic
         mode = instruction.mode
         
@@ -277,23 +560,15 @@ class ConfigCPUProfile:
         if not mode_name:
             return
         
-        # Get post-processing rules from YAML
-        post_processing = self._profile_data.get("post_processing", {})
-        
         # Branch instruction handling
-        branch_rules = post_processing.get("branch_instructions", {})
-        if mnemonic in branch_rules.get("mnemonics", []):
-            target_mode = branch_rules.get("force_mode")
-            if target_mode:
-                instruction.mode = self.get_addressing_mode_enum(target_mode)
+        if self._branch_force_mode is not None and mnemonic in self._branch_force_mnemonics:
+            instruction.mode = self._branch_force_mode
         
         # Automatic mode conversion rules
-        auto_conversion = post_processing.get("automatic_mode_conversion", [])
-        for rule in auto_conversion:
-            if (mode_name == rule["from_mode"] and 
-                isinstance(instruction.operand_value, int) and 
-                instruction.operand_value <= rule["threshold"]):
-                instruction.mode = self.get_addressing_mode_enum(rule["to_mode"])
+        value = instruction.operand_value
+        for threshold, _, target_enum, _ in self._auto_conversions.get(mode_name, ()):
+            if isinstance(value, int) and threshold is not None and value <= threshold:
+                instruction.mode = target_enum
     
     def parse_directive(self, instruction, parser: 'Parser') -> None:
         """Parse assembler directive using YAML configuration."""
@@ -323,50 +598,31 @@ class ConfigCPUProfile:
         mnemonic = instruction.mnemonic
         mode = instruction.mode
         
-        if mnemonic not in self.opcodes:
-            return None
-        
         # Convert mode enum to string for lookup
         mode_name = self.get_addressing_mode_name(mode)
         
-        if mode_name and mode_name in self.opcodes[mnemonic]:
-            opcode_details = self.opcodes[mnemonic][mode_name]
-            # Convert hex string opcodes to integers
-            if isinstance(opcode_details, list) and len(opcode_details) > 0:
-                opcode_details[0] = self._convert_opcode_to_int(opcode_details[0])
+        opcode_details = self._opcode_table.get((mnemonic, mode_name))
+        if opcode_details is not None:
             return opcode_details
         
+        if mnemonic not in self.opcodes:
+            return None
+        
         # Handle automatic mode conversion (e.g., 6800 EXTENDED to DIRECT)
-        post_processing = self._profile_data.get("post_processing", {})
-        auto_conversion = post_processing.get("automatic_mode_conversion", [])
-        
-        for rule in auto_conversion:
-            if (mode_name == rule["from_mode"] and 
-                mnemonic in self.opcodes):
-                condition = rule.get("condition")
-                if condition:
-                    # Simple condition evaluation for mode conversion
-                    target_mode = rule["to_mode"]
-                    if target_mode in self.opcodes[mnemonic]:
-                        instruction.mode = self.get_addressing_mode_enum(target_mode)
-                        opcode_details = self.opcodes[mnemonic][target_mode]
-                        if isinstance(opcode_details, list) and len(opcode_details) > 0:
-                            opcode_details[0] = self._convert_opcode_to_int(opcode_details[0])
-                        return opcode_details
-                elif isinstance(instruction.operand_value, int) and instruction.operand_value <= rule["threshold"]:
-                    target_mode = rule["to_mode"]
-                    if target_mode in self.opcodes[mnemonic]:
-                        instruction.mode = self.get_addressing_mode_enum(target_mode)
-                        opcode_details = self.opcodes[mnemonic][target_mode]
-                        if isinstance(opcode_details, list) and len(opcode_details) > 0:
-                            opcode_details[0] = self._convert_opcode_to_int(opcode_details[0])
-                        return opcode_details
+        value = instruction.operand_value
+        for threshold, target_mode, target_enum, has_condition in self._auto_conversions.get(mode_name, ()):
+            # Conditional rules apply whenever the target mode exists for the mnemonic
+            if has_condition or (isinstance(value, int) and threshold is not None and value <= threshold):
+                opcode_details = self._opcode_table.get((mnemonic, target_mode))
+                if opcode_details is not None:
+                    instruction.mode = target_enum
+                    return opcode_details
         
         return None
     
     def validate_instruction(self, instruction) -> bool:
         """Validate instruction using generic rule engine."""
-        mnemonic = instruction.mnemonic.upper() if instruction.mnemonic else ""
+        mnemonic = instruction.mnemonic or ""  # Already upper-cased and interned by the parser
         mode = instruction.mode
         operand_value = instruction.operand_value
         
@@ -390,132 +646,51 @@ class ConfigCPUProfile:
     
     def _validate_with_generic_rules(self, instruction, mnemonic: str, mode_name: str, operand_value) -> bool:
         """Validate using the new generic rule format."""
-        validation_rules = self.validation_rules
+        rules = self._validation_rules_by_mnemonic.get(mnemonic, self._global_validation_rules)
         
-        for rule in validation_rules:
-            rule_type = rule.get("type")
-            if not rule_type:
-                continue
-                
-            # Check if this rule applies to this mnemonic
-            mnemonics = rule.get("mnemonics", [])
-            if mnemonics and mnemonic not in mnemonics:
+        for check, is_error in rules:
+            formatted_msg = check(mnemonic, mode_name, operand_value)
+            if formatted_msg is None:
                 continue
-            
-            # Execute the rule based on its type
-            if not self._execute_validation_rule(rule, rule_type, instruction, mnemonic, mode_name, operand_value):
-                return False  # Error occurred, stop validation
-        
-        return True
-    
-    def _execute_validation_rule(self, rule: dict, rule_type: str, instruction, mnemonic: str, mode_name: str, operand_value) -> bool:
-        """Execute a single validation rule."""
-        message = rule.get("message", "")
-        
-        if rule_type == "error_if_mode_is":
-            modes = rule.get("modes", [])
-            if mode_name in modes:
-                formatted_msg = message.format(mnemonic=mnemonic, mode=mode_name)
-                self.diagnostics.error(instruction.line_num, formatted_msg)
-                return False
-                
-        elif rule_type == "error_if_mode_is_not":
-            modes = rule.get("modes", [])
-            if mode_name not in modes:
-                formatted_msg = message.format(mnemonic=mnemonic, mode=mode_name, valid_modes=", ".join(modes))
+            if is_error:
                 self.diagnostics.error(instruction.line_num, formatted_msg)
-                return False
-                
-        elif rule_type == "warning_if_mode_is":
-            modes = rule.get("modes", [])
-            if mode_name in modes:
-                formatted_msg = message.format(mnemonic=mnemonic, mode=mode_name)
-                self.diagnostics.warning(instruction.line_num, formatted_msg)
-                
-        elif rule_type == "warning_if_mode_is_not":
-            modes = rule.get("modes", [])
-            if mode_name not in modes:
-                formatted_msg = message.format(mnemonic=mnemonic, mode=mode_name, valid_modes=", ".join(modes))
-                self.diagnostics.warning(instruction.line_num, formatted_msg)
-                
-        elif rule_type == "error_if_operand_out_of_range":
-            if isinstance(operand_value, int):
-                # Check for exceptions
-                exceptions = rule.get("exceptions", [])
-                if mnemonic in exceptions:
-                    return True  # Skip this rule for exception mnemonics
-                    
-                min_val = rule.get("min_value", 0)
-                max_val = rule.get("max_value", 255)
-                if not (min_val <= operand_value <= max_val):
-                    formatted_msg = message.format(mnemonic=mnemonic, value=operand_value, min_value=min_val, max_value=max_val)
-                    self.diagnostics.error(instruction.line_num, formatted_msg)
-                    return False
-                    
-        elif rule_type == "warning_if_operand_out_of_range":
-            if isinstance(operand_value, int):
-                # Check for exceptions
-                exceptions = rule.get("exceptions", [])
-                if mnemonic in exceptions:
-                    return True  # Skip this rule for exception mnemonics
-                    
-                min_val = rule.get("min_value", 0)
-                max_val = rule.get("max_value", 255)
-                if not (min_val <= operand_value <= max_val):
-                    formatted_msg = message.format(mnemonic=mnemonic, value=operand_value, min_value=min_val, max_value=max_val)
-                    self.diagnostics.warning(instruction.line_num, formatted_msg)
-                    
-        elif rule_type == "error_if_register_used":
-            # For register-specific validation (e.g., Y register warnings)
-            register = rule.get("register", "")
-            if hasattr(operand_value, 'register') and operand_value.register == register:
-                formatted_msg = message.format(mnemonic=mnemonic, register=register)
-                self.diagnostics.error(instruction.line_num, formatted_msg)
-                return False
-                
-        elif rule_type == "warning_if_register_used":
-            # For register-specific validation (e.g., Y register warnings)
-            register = rule.get("register", "")
-            if hasattr(operand_value, 'register') and operand_value.register == register:
-                formatted_msg = message.format(mnemonic=mnemonic, register=register)
-                self.diagnostics.warning(instruction.line_num, formatted_msg)
+                return False  # Error occurred, stop validation
+            self.diagnostics.warning(instruction.line_num, formatted_msg)
         
         return True
     
     def _validate_with_legacy_rules(self, instruction, mnemonic: str, mode_name: str, operand_value) -> bool:
         """Validate using the legacy rule format (for backward compatibility)."""
-        validation_rules = self.validation_rules
-        
         # Check accumulator-only instructions
-        accumulator_only = validation_rules.get("accumulator_only", {})
-        if mnemonic in accumulator_only and mode_name in accumulator_only[mnemonic]:
+        modes = self._accumulator_only.get(mnemonic)
+        if modes is not None and mode_name in modes:
             self.diagnostics.error(instruction.line_num,
                 f"Instruction '{mnemonic}' must use inherent addressing (no operands).")
             return False
         
         # Check inherent-only instructions
-        inherent_only = validation_rules.get("inherent_only", {})
-        if mnemonic in inherent_only and mode_name not in inherent_only[mnemonic]:
+        modes = self._inherent_only.get(mnemonic)
+        if modes is not None and mode_name not in modes:
             self.diagnostics.error(instruction.line_num,
                 f"Instruction '{mnemonic}' must use inherent addressing (no operands).")
             return False
         
         # Check branch instruction valid modes
-        branch_valid_modes = validation_rules.get("branch_valid_modes", {})
-        if mnemonic in branch_valid_modes and mode_name not in branch_valid_modes[mnemonic]:
-            valid_modes = ", ".join(branch_valid_modes[mnemonic])
+        modes = self._branch_valid_modes.get(mnemonic)
+        if modes is not None and mode_name not in modes:
+            valid_modes = ", ".join(modes)
             self.diagnostics.error(instruction.line_num,
                 f"Branch instruction '{mnemonic}' requires {valid_modes} addressing.")
             return False
         
         # Check inherent warnings
-        inherent_warnings = validation_rules.get("inherent_warnings", {})
-        if mnemonic in inherent_warnings and mode_name not in inherent_warnings[mnemonic]:
+        modes = self._inherent_warnings.get(mnemonic)
+        if modes is not None and mode_name not in modes:
             self.diagnostics.warning(instruction.line_num,
                 f"Instruction '{mnemonic}' typically uses inherent addressing. Operands may be ignored.")
         
         # Check optimization hints
-        optimization = validation_rules.get("optimization_hints", {})
+        optimization = self._optimization_hints
         
         # Direct page optimization (6800 equivalent of zeropage)
         if "direct_page_optimization" in optimization:
@@ -543,8 +718,6 @@ class ConfigCPUProfile:
     
     def handle_directive_pass1(self, instruction, symbol_table, current_address: int) -> int:
         """Handle directive processing during first pass. Returns new current_address."""
-        from expression_evaluator import evaluate_expression
-        
         directive = instruction.directive
         directive_info = self.directives.get(directive, {})
         
@@ -581,91 +754,78 @@ class ConfigCPUProfile:
     
     def handle_directive_pass2(self, instruction, symbol_table) -> bool:
         """Handle directive processing during second pass. Returns True on success."""
-        from core.expression_evaluator import evaluate_expression
-        
-        directive = instruction.directive
-        directive_info = self.directives.get(directive, {})
-        
-        if directive == ".BYTE":
-            machine_code = []
-            for v in instruction.operand_value:
-                val = evaluate_expression(v, symbol_table, instruction.line_num, instruction.address)
-                if val is None:
-                    self.diagnostics.error(instruction.line_num, f"Undefined symbol in .BYTE directive.")
-                    return False
-                if not 0 <= val < 256:
-                    self.diagnostics.error(instruction.line_num, f"Byte value '{val}' out of range (0-255).")
-                    return False
-                machine_code.append(val & 0xFF)
-            instruction.machine_code = machine_code
-            return True
-            
-        elif directive == ".WORD":
-            machine_code = []
-            for v in instruction.operand_value:
-                val = evaluate_expression(v, symbol_table, instruction.line_num)
-                if val is None:
-                    self.diagnostics.error(instruction.line_num, f"Undefined symbol in .WORD directive.")
-                    return False
-                if not 0 <= val < 65536:
-                    self.diagnostics.error(instruction.line_num, f"Word value '{val}' out of range (0-65535).")
-                    return False
-                # Check endianness from CPU info
-                endianness = self.cpu_info.get("endianness", "little")
-                if endianness == "little":
-                    machine_code.extend([val & 0xFF, (val >> 8) & 0xFF])
-                else:  # big endian
-                    machine_code.extend([(val >> 8) & 0xFF, val & 0xFF])
-            instruction.machine_code = machine_code
-            return True
-            
-        elif directive in ("EQU", ".ORG", ".DS"):
-            # These directives are handled in pass 1, nothing to do in pass 2
-            return True
-            
-        else:
-            # Unknown directive - skip
+        encoder = self._directive_encoders.get(instruction.directive)
+        if encoder is None:
+            # EQU, .ORG, .DS are handled in pass 1; unknown directives are skipped
             return True
+        return encoder(instruction, symbol_table)
+
+    def _encode_byte_directive(self, instruction, symbol_table) -> bool:
+        """Emit machine code for a .BYTE directive."""
+        values = []
+        for v in instruction.operand_value:
+            val = evaluate_ast(v, symbol_table, instruction.line_num, instruction.address)
+            if val is None:
+                self.diagnostics.error(instruction.line_num, f"Undefined symbol in .BYTE directive.")
+                return False
+            if val & ~0xFF:  # Also rejects negatives, whose high bits are set
+                self.diagnostics.error(instruction.line_num, f"Byte value '{val}' out of range (0-255).")
+                return False
+            values.append(val)
+        # Values are range-checked above, so they are already valid bytes
+        instruction.machine_code = bytes(values)
+        return True
+
+    def _encode_word_directive(self, instruction, symbol_table) -> bool:
+        """Emit machine code for a .WORD directive."""
+        values = []
+        for v in instruction.operand_value:
+            val = evaluate_ast(v, symbol_table, instruction.line_num)
+            if val is None:
+                self.diagnostics.error(instruction.line_num, f"Undefined symbol in .WORD directive.")
+                return False
+            if val & ~0xFFFF:  # Also rejects negatives, whose high bits are set
+                self.diagnostics.error(instruction.line_num, f"Word value '{val}' out of range (0-65535).")
+                return False
+            values.append(val)
+        instruction.machine_code = _pack_words(values, self._big_endian)
+        return True
 
     def encode_instruction(self, instruction, symbol_table) -> bool:
         """Generic instruction encoding using YAML configuration."""
-        from core.expression_evaluator import evaluate_expression
-        
         mnemonic = instruction.mnemonic
         mode = instruction.mode
 
-        details = self.get_opcode_details(instruction, symbol_table)
-        if details is None:
-            return False
-            
-        opcode, operand_size, _, _ = details
+        entry = self._encode_table.get((mnemonic, mode))
+        if entry is not None:
+            opcode, operand_size = entry
+        else:
+            # Not a direct hit: let get_opcode_details() apply automatic mode conversion
+            details = self.get_opcode_details(instruction, symbol_table)
+            if details is None:
+                return False
+            opcode, operand_size, _, _ = details
 
         try:
             val = evaluate_expression(instruction.operand_value, symbol_table, instruction.line_num)
             if operand_size == 0:
-                instruction.machine_code = [opcode]
+                instruction.machine_code = bytes((opcode,))
             elif operand_size > 0:
                 if val is None:
                     raise ValueError(f"Mnemonic '{mnemonic}' requires an operand but none was provided.")
                 if operand_size == 1:
                     # Handle relative branches
-                    relative_mode = self.get_addressing_mode_enum("RELATIVE")
-                    if mode == relative_mode:
+                    if mode == self._mode_relative:
                         offset = val - (instruction.address + 2)
                         if not -128 <= offset <= 127:
                             raise ValueError(f"Branch offset out of range: {offset}")
-                        instruction.machine_code = [opcode, offset & 0xFF]
+                        instruction.machine_code = bytes((opcode, offset & 0xFF))
                     else:
-                        if not 0 <= val < 256:
+                        if val & ~0xFF:  # Also rejects negatives, whose high bits are set
                             raise ValueError(f"Value out of range for 1-byte operand: {val}")
-                        instruction.machine_code = [opcode, val & 0xFF]
+                        instruction.machine_code = bytes((opcode, val & 0xFF))
                 elif operand_size == 2:
-                    # Check endianness from CPU info
-                    endianness = self.cpu_info.get("endianness", "little")
-                    if endianness == "little":
-                        instruction.machine_code = [opcode, val & 0xFF, (val >> 8) & 0xFF]
-                    else:  # big endian
-                        instruction.machine_code = [opcode, (val >> 8) & 0xFF, val & 0xFF]
+                    instruction.machine_code = self._pack_opcode_word(opcode, val & 0xFFFF)
                 else:
                     raise ValueError(f"Unsupported operand size: {operand_size}")
         except ValueError as e:
@@ -73,6 +73,7 @@ def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="A multi-CPU assembler.")
     parser.add_argument("source_file", help="Assembly source file")
     parser.add_argument("-o", "--output", help="Output binary file")
+    parser.add_argument("--format", default="bin", choices=["bin", "hex"], help="Output format: flat binary image or Intel HEX.")
     parser.add_argument("--cpu", default="65c02", choices=SUPPORTED_CPUS.keys(), help="The target CPU profile.")
     parser.add_argument("--log-file", help="Specify a file to write detailed logs to.")
     parser.add_argument("--start-address", type=lambda x: int(x, 0), default=0x0000, help="Starting address (e.g., 0x8000)")
@@ -118,9 +119,9 @@ def main() -> bool:
         return False
 
     if assembler.assemble(program, args.start_address):
-        output_file = args.output or f"{args.source_file}.bin"
+        output_file = args.output or f"{args.source_file}.{args.format}"
         emitter.print_pass_listing("Final Assembly Listing", program)
-        emitter.write_binary(program, output_file, profile)
+        emitter.write_binary(program, output_file, profile, args.format)
         diagnostics.print_summary()
         return True
     else:
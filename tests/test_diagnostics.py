@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+
+import unittest
+import sys
+import os
+import io
+from unittest.mock import patch
+
+# Add the compiler directory to the path to import modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'compiler'))
+
+from core.diagnostics import Diagnostics
+
+
+class TestDiagnostics(unittest.TestCase):
+    """Unit tests for diagnostic reporting and output batching"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.diagnostics = Diagnostics()
+
+    def test_batch_defers_output_until_end(self):
+        """Test that batched messages are held back and then written in order"""
+        with patch('sys.stdout', new_callable=io.StringIO) as out:
+            self.diagnostics.begin_batch()
+            self.diagnostics.warning(1, "first")
+            self.diagnostics.error(2, "second")
+            self.diagnostics.info("third")
+            self.assertEqual(out.getvalue(), "")
+
+            self.diagnostics.end_batch()
+            self.assertEqual(out.getvalue(),
+                             "Warning on line 1: first\n"
+                             "Error on line 2: second\n"
+                             "third\n")
+
+    def test_batch_keeps_counts(self):
+        """Test that error and warning counts are updated while batching"""
+        with patch('sys.stdout', new_callable=io.StringIO):
+            self.diagnostics.begin_batch()
+            self.diagnostics.warning(1, "a")
+            self.assertFalse(self.diagnostics.has_errors())
+            self.diagnostics.error(2, "b")
+            self.diagnostics.error(3, "c")
+            self.assertTrue(self.diagnostics.has_errors())
+            self.diagnostics.end_batch()
+
+        self.assertEqual(self.diagnostics._error_count, 2)
+        self.assertEqual(self.diagnostics._warning_count, 1)
+
+    def test_output_is_direct_outside_batch(self):
+        """Test that messages print immediately when no batch is open"""
+        with patch('sys.stdout', new_callable=io.StringIO) as out:
+            self.diagnostics.begin_batch()
+            self.diagnostics.end_batch()
+            self.diagnostics.error(None, "now")
+            self.assertEqual(out.getvalue(), "Error: now\n")
+
+            # Ending a batch that was never started writes nothing
+            self.diagnostics.end_batch()
+            self.assertEqual(out.getvalue(), "Error: now\n")
+
+    def test_nested_batch_flushes_at_outermost_end(self):
+        """Test that ending an inner batch keeps the outer batch queued"""
+        with patch('sys.stdout', new_callable=io.StringIO) as out:
+            self.diagnostics.begin_batch()
+            self.diagnostics.info("outer")
+            self.diagnostics.begin_batch()
+            self.diagnostics.info("inner")
+            self.diagnostics.end_batch()
+            self.diagnostics.info("after inner")
+            self.assertEqual(out.getvalue(), "")
+
+            self.diagnostics.end_batch()
+            self.assertEqual(out.getvalue(), "outer\ninner\nafter inner\n")
+
+            # A stray extra end_batch() does not disturb direct output
+            self.diagnostics.end_batch()
+            self.diagnostics.info("direct")
+            self.assertEqual(out.getvalue(), "outer\ninner\nafter inner\ndirect\n")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+
+import unittest
+import sys
+import os
+import tempfile
+from unittest.mock import MagicMock
+
+# Add the compiler directory to the path to import modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'compiler'))
+
+from core.emitter import Emitter
+from core.diagnostics import Diagnostics
+from core.symbol_table import SymbolTable
+from core.program import Program
+from core.instruction import Instruction
+
+
+class TestEmitter(unittest.TestCase):
+    """Unit tests for binary and Intel HEX output"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.diagnostics = Diagnostics()
+        self.emitter = Emitter(self.diagnostics)
+        self.program = Program(SymbolTable(self.diagnostics))
+        self.profile = MagicMock()
+        self.profile.cpu_info = {"fill_byte": "0xEA"}
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def add(self, address, machine_code):
+        instr = Instruction(len(self.program.instructions) + 1)
+        instr.address = address
+        instr.size = len(machine_code)
+        instr.machine_code = machine_code
+        self.program.add_instruction(instr)
+
+    def test_binary_image_is_padded_with_fill_byte(self):
+        """Test that gaps between instructions use the profile's fill byte"""
+        self.add(0x8000, [0xA9, 0xFF])
+        self.add(0x8004, [0x00])
+        output_file = os.path.join(self.tmp_dir.name, "out", "test.bin")
+
+        self.assertTrue(self.emitter.write_binary(self.program, output_file, self.profile))
+        with open(output_file, "rb") as f:
+            self.assertEqual(f.read(), bytes([0xA9, 0xFF, 0xEA, 0xEA, 0x00]))
+
+    def test_intel_hex_writes_only_emitted_segments(self):
+        """Test Intel HEX records, checksums, and the end-of-file record"""
+        self.add(0x8000, [0xA9, 0xFF])
+        self.add(0x8002, [0xEA])
+        self.add(0xFFFC, [0x00, 0x80])
+        output_file = os.path.join(self.tmp_dir.name, "test.hex")
+
+        self.assertTrue(self.emitter.write_binary(self.program, output_file, self.profile, "hex"))
+        with open(output_file) as f:
+            records = f.read().splitlines()
+        self.assertEqual(records, [
+            ":03800000A9FFEAEB",
+            ":02FFFC00008083",
+            ":00000001FF",
+        ])
+
+    def test_overlapping_org_keeps_the_later_write(self):
+        """Test that code .ORG'd back over earlier bytes overwrites them in both formats"""
+        self.add(0x8000, [0x01, 0x02, 0x03, 0x04])
+        self.add(0x8001, bytes([0xAA, 0xBB]))
+        bin_file = os.path.join(self.tmp_dir.name, "test.bin")
+        hex_file = os.path.join(self.tmp_dir.name, "test.hex")
+
+        self.assertTrue(self.emitter.write_binary(self.program, bin_file, self.profile))
+        self.assertTrue(self.emitter.write_binary(self.program, hex_file, self.profile, "hex"))
+        with open(bin_file, "rb") as f:
+            self.assertEqual(f.read(), bytes([0x01, 0xAA, 0xBB, 0x04]))
+        with open(hex_file) as f:
+            self.assertEqual(f.read().splitlines(), [":0480000001AABB0412", ":00000001FF"])
+
+    def test_intel_hex_same_address_mixed_payload_types(self):
+        """Test that chunks at one address are ordered by emission, not by payload"""
+        self.add(0x8000, [0x01, 0x02])
+        self.add(0x8000, bytes([0x09]))
+        output_file = os.path.join(self.tmp_dir.name, "test.hex")
+
+        self.assertTrue(self.emitter.write_binary(self.program, output_file, self.profile, "hex"))
+        with open(output_file) as f:
+            self.assertEqual(f.read().splitlines(), [":02800000090273", ":00000001FF"])
+
+    def test_code_outside_image_warns_in_both_formats(self):
+        """Test that both formats report machine code beyond the placed instructions"""
+        self.add(0x8000, [0xA9, 0xFF])
+        self.add(0x8002, [0xEA])
+        self.program.instructions[-1].size = 0  # Code without a size lies outside the image
+
+        for output_format in ("bin", "hex"):
+            diagnostics = Diagnostics()
+            emitter = Emitter(diagnostics)
+            output_file = os.path.join(self.tmp_dir.name, f"test.{output_format}")
+            self.assertTrue(emitter.write_binary(self.program, output_file, self.profile, output_format))
+            self.assertEqual(diagnostics._warning_count, 1, msg=output_format)
+
+
+if __name__ == '__main__':
+    unittest.main()
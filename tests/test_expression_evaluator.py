@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+
+import unittest
+import sys
+import os
+import operator
+
+# Add the compiler directory to the path to import modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'compiler'))
+
+from core.diagnostics import Diagnostics
+from core.symbol_table import SymbolTable
+from core.expression_parser import parse_expression, BinOp, Number, Symbol
+from core.expression_evaluator import evaluate_expression, evaluate_ast, compile_expression, OP_CONST, OP_SYMBOL, OP_BINARY
+
+
+class TestExpressionEvaluator(unittest.TestCase):
+    """Unit tests for expression compilation and evaluation"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.diagnostics = Diagnostics()
+        self.symbol_table = SymbolTable(self.diagnostics)
+        self.symbol_table.add("START", 0x8000, 1)
+        self.symbol_table.add("COUNT", 3, 2)
+
+    def evaluate(self, src, current_address=0):
+        return evaluate_expression(parse_expression(src), self.symbol_table, 1, current_address)
+
+    def test_arithmetic_and_precedence(self):
+        """Test binary operators respect parser precedence"""
+        self.assertEqual(self.evaluate("2 + 3 * 4"), 14)
+        self.assertEqual(self.evaluate("(2 + 3) * 4"), 20)
+        self.assertEqual(self.evaluate("7 / 2"), 3)
+        self.assertEqual(self.evaluate("$F0 & $3C | 1"), 0x31)
+        self.assertEqual(self.evaluate("1 << 4 >> 2"), 4)
+        self.assertEqual(self.evaluate("$FF ^ %1010"), 0xF5)
+
+    def test_unary_operators(self):
+        """Test negation and low/high byte selection"""
+        self.assertEqual(self.evaluate("-5"), -5)
+        self.assertEqual(self.evaluate("<$1234"), 0x34)
+        self.assertEqual(self.evaluate(">$1234"), 0x12)
+
+    def test_symbols_and_current_address(self):
+        """Test symbol resolution and the '*' program counter"""
+        self.assertEqual(self.evaluate("START + COUNT"), 0x8003)
+        self.assertEqual(self.evaluate("start"), 0x8000)
+
+        # The parser has no '*' token, so build the program counter node directly
+        node = BinOp(Symbol("*"), '+', Number(2))
+        self.assertEqual(evaluate_ast(node, self.symbol_table, 1, 0x1234), 0x1236)
+        # The cached program must not have folded '*' into a constant
+        self.assertEqual(evaluate_ast(node, self.symbol_table, 1, 0x2000), 0x2002)
+        self.assertEqual(evaluate_expression(node, self.symbol_table, 1, 0x10), 0x12)
+
+    def test_undefined_symbol_raises(self):
+        """Test that unresolved symbols raise ValueError"""
+        with self.assertRaises(ValueError):
+            self.evaluate("MISSING + 1")
+
+    def test_none_and_int_passthrough(self):
+        """Test that None and raw integers are returned unchanged"""
+        self.assertIsNone(evaluate_expression(None, self.symbol_table, 1))
+        self.assertEqual(evaluate_expression(42, self.symbol_table, 1), 42)
+
+    def test_syntax_errors_raise(self):
+        """Test that malformed expressions raise ValueError from the parser"""
+        for src in ("1 2", "*", "A +", "(A", "A)", "$G", "A < B"):
+            with self.assertRaises(ValueError, msg=src):
+                parse_expression(src)
+
+    def test_compile_emits_postfix(self):
+        """Test that the compiler emits operands before their operator"""
+        code = compile_expression(BinOp(Number(1), '+', parse_expression("COUNT")))
+        self.assertEqual(code, [(OP_CONST, 1), (OP_SYMBOL, "COUNT"), (OP_BINARY, operator.add)])
+
+    def test_constant_expressions_are_folded(self):
+        """Test that symbol-free expressions compile to a single constant"""
+        self.assertEqual(compile_expression(parse_expression("(2 + 3) * 4")), [(OP_CONST, 20)])
+        self.assertEqual(self.evaluate("<$1234 + 1"), 0x35)
+        self.assertEqual(len(compile_expression(parse_expression("COUNT * 2"))), 3)
+
+    def test_forward_reference_late_binding(self):
+        """Test that a cached program picks up symbols defined after first evaluation"""
+        node = parse_expression("LATER + 1")
+        with self.assertRaises(ValueError):
+            evaluate_expression(node, self.symbol_table, 1)
+        self.symbol_table.add("LATER", 0x10, 3)
+        self.assertEqual(evaluate_expression(node, self.symbol_table, 1), 0x11)
+
+    def test_evaluate_ast_matches_general_entry(self):
+        """Test that the strict AST entry point agrees with evaluate_expression"""
+        for src in ("START + COUNT", "(2 + 3) * 4", "<START + 1"):
+            node = parse_expression(src)
+            self.assertEqual(evaluate_ast(node, self.symbol_table, 1, 0x100),
+                             evaluate_expression(node, self.symbol_table, 1, 0x100), msg=src)
+
+
+if __name__ == '__main__':
+    unittest.main()
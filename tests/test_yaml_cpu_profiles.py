@@ -19,6 +19,10 @@ class TestYAMLConfigCPUProfile(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures"""
         self.diagnostics = Diagnostics()
+        # Several tests load mocked files, so give each test an empty profile cache
+        cache = patch.dict("cpu_profile_base._PROFILE_CACHE", clear=True)
+        cache.start()
+        self.addCleanup(cache.stop)
         
         # Create a minimal valid YAML profile structure based on the actual format
         self.valid_profile_data = {
@@ -100,6 +104,17 @@ class TestYAMLConfigCPUProfile(unittest.TestCase):
         self.assertEqual(modes.value, 0)  # Enum value
         self.assertEqual(modes.name, "IMPLIED")  # Enum name
 
+    def test_get_addressing_mode_name(self):
+        """Test mode name lookup from enum members and raw integer values"""
+        import yaml
+        with patch("builtins.open", mock_open(read_data=yaml.dump(self.valid_profile_data))):
+            profile = ConfigCPUProfile(self.diagnostics, "test_profile.yaml")
+
+        self.assertEqual(profile.get_addressing_mode_name(profile.AddressingMode.ABSOLUTE), "ABSOLUTE")
+        self.assertEqual(profile.get_addressing_mode_name(1), "IMMEDIATE")
+        self.assertIsNone(profile.get_addressing_mode_name(99))
+        self.assertIsNone(profile.get_addressing_mode_name(None))
+
     def test_get_opcode_details(self):
         """Test getting opcode information"""
         import yaml
@@ -116,6 +131,46 @@ class TestYAMLConfigCPUProfile(unittest.TestCase):
         self.assertEqual(details[0], 0xA9)  # opcode
         self.assertEqual(details[1], 1)    # operand size
 
+    def test_legacy_validation_rules(self):
+        """Test dict-format validation rules against valid and invalid modes"""
+        import yaml
+        with patch("builtins.open", mock_open(read_data=yaml.dump(self.valid_profile_data))):
+            profile = ConfigCPUProfile(self.diagnostics, "test_profile.yaml")
+
+        instruction = MagicMock()
+        instruction.mnemonic = "NOP"
+        instruction.operand_value = None
+        instruction.mode = profile.AddressingMode.IMPLIED
+        self.assertTrue(profile.validate_instruction(instruction))
+        self.assertFalse(self.diagnostics.has_errors())
+
+        instruction.mode = profile.AddressingMode.ABSOLUTE
+        self.assertFalse(profile.validate_instruction(instruction))
+        self.assertTrue(self.diagnostics.has_errors())
+
+    def test_generic_validation_rules(self):
+        """Test list-format validation rules dispatch to errors and warnings by type"""
+        import yaml
+        self.valid_profile_data["validation_rules"] = [
+            {"type": "warning_if_mode_is", "mnemonics": ["LDA"], "modes": ["IMMEDIATE"],
+             "message": "{mnemonic} uses {mode}"},
+            {"type": "error_if_mode_is_not", "mnemonics": ["STA"], "modes": ["ABSOLUTE"],
+             "message": "{mnemonic} needs one of {valid_modes}"},
+        ]
+        with patch("builtins.open", mock_open(read_data=yaml.dump(self.valid_profile_data))):
+            profile = ConfigCPUProfile(self.diagnostics, "test_profile.yaml")
+
+        instruction = MagicMock()
+        instruction.mnemonic = "LDA"
+        instruction.operand_value = None
+        instruction.mode = profile.AddressingMode.IMMEDIATE
+        self.assertTrue(profile.validate_instruction(instruction))
+        self.assertFalse(self.diagnostics.has_errors())
+
+        instruction.mnemonic = "STA"
+        self.assertFalse(profile.validate_instruction(instruction))
+        self.assertTrue(self.diagnostics.has_errors())
+
     def test_parse_addressing_mode(self):
         """Test parsing addressing modes"""
         import yaml
@@ -141,6 +196,39 @@ class TestYAMLConfigCPUProfile(unittest.TestCase):
         # For implied mode with group_index=None, value is the full operand
         self.assertEqual(value, "NOP")
 
+    def test_combined_pattern_matches_per_pattern_order(self):
+        """Test that the merged addressing mode regex agrees with trying patterns one by one"""
+        path = os.path.join(os.path.dirname(__file__), '..', 'compiler', 'cpu_profiles', '6800.yaml')
+        profile = ConfigCPUProfile(self.diagnostics, path)
+        per_pattern = ConfigCPUProfile(self.diagnostics, path)
+        self.assertIsNotNone(profile._combined_match)
+        per_pattern._combined_match = None
+
+        def parse_all(p):
+            # Each profile instance has its own dynamic enum, so compare mode names
+            return [(mode.name, value) for mode, value in map(p.parse_addressing_mode, operands)]
+
+        operands = ["A", "B", "#$10", "$10,X", "$10", "$1234", "200", "1000", "LABEL", "NOP"]
+        self.assertEqual(parse_all(profile), parse_all(per_pattern))
+
+    def test_unchanged_profile_is_parsed_once(self):
+        """Test that reloading an unchanged profile file reuses the parsed data"""
+        path = os.path.join(os.path.dirname(__file__), '..', 'compiler', 'cpu_profiles', '6800.yaml')
+        first = ConfigCPUProfile(self.diagnostics, path)
+        with patch("yaml.load") as mock_load:
+            second = ConfigCPUProfile(self.diagnostics, path)
+        mock_load.assert_not_called()
+        self.assertIs(second._profile_data, first._profile_data)
+
+    def test_equal_cycle_dicts_are_shared(self):
+        """Test that identical cycle-count dicts in opcode rows are pooled at load"""
+        path = os.path.join(os.path.dirname(__file__), '..', 'compiler', 'cpu_profiles', '65c02.yaml')
+        profile = ConfigCPUProfile(self.diagnostics, path)
+        adc = profile.opcodes["ADC"]["IMMEDIATE"][2]
+        lda = profile.opcodes["LDA"]["IMMEDIATE"][2]
+        self.assertEqual(adc, {"base": 2})
+        self.assertIs(adc, lda)
+
     def test_file_not_found(self):
         """Test handling of missing profile file"""
         with self.assertRaises(FileNotFoundError):
@@ -159,6 +247,10 @@ class TestCPUProfileFactory(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures"""
         self.diagnostics = Diagnostics()
+        # Several tests load mocked files, so give each test an empty profile cache
+        cache = patch.dict("cpu_profile_base._PROFILE_CACHE", clear=True)
+        cache.start()
+        self.addCleanup(cache.stop)
 
     @patch('os.path.exists')
     @patch('os.listdir')